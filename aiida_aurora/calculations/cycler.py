@@ -16,6 +16,9 @@ from aiida_aurora.data.control import TomatoSettingsData
 from aiida_aurora.data.experiment import CyclingSpecsData
 from aiida_aurora.schemas.dgbowl import conversion_map, payload_models
 
+# use the LibYAML-based dumper, if available
+Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 class BatteryCyclerExperiment(CalcJob):
     """
@@ -135,7 +138,7 @@ class BatteryCyclerExperiment(CalcJob):
         # END HOTFIX
 
         with folder.open(self.options.input_filename, "w", encoding="utf8") as handle:
-            handle.write(yaml.dump(payload_dict))
+            handle.write(yaml.dump(payload_dict, Dumper=Dumper))
 
         codeinfo = datastructures.CodeInfo()
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from json import load
+from json import JSONDecodeError
 from tempfile import NamedTemporaryFile
 
 from aiida.common.log import LOG_LEVEL_REPORT
@@ -8,6 +8,7 @@ from aiida.orm import CalcJobNode
 from aiida.transports import Transport
 
 from .utils.analyzers import CapacityAnalyzer
+from .utils.parsers import json_loads
 
 
 def monitor_capacity_threshold(
@@ -39,6 +40,8 @@ def monitor_capacity_threshold(
     ------
     `TypeError`
         If source file is not in expected dictionary format (JSON).
+    `JSONDecodeError`
+        If source file could not be parsed.
     `ValueError`
         If source file is empty.
     `FileNotFoundError`
@@ -65,7 +68,7 @@ def monitor_capacity_threshold(
 
                 with NamedTemporaryFile("w+") as temp_file:
                     transport.getfile(remote_path, temp_file.name)
-                    snapshot = load(temp_file)
+                    snapshot = json_loads(temp_file.read())
 
                 if not isinstance(snapshot, dict):
                     raise TypeError
@@ -96,6 +99,8 @@ def monitor_capacity_threshold(
 
             except TypeError:
                 node.logger.error(f"'{filename}' not in dictionary format")
+            except JSONDecodeError:
+                node.logger.error(f"'{filename}' could not be parsed")
             except ValueError:
                 node.logger.error(f"'{filename}' is empty")
             except FileNotFoundError:
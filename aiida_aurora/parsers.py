@@ -15,6 +15,8 @@ from aiida.orm import ArrayData, SinglefileData
 from aiida.parsers.parser import Parser
 from aiida.plugins import CalculationFactory
 
+from aiida_aurora.utils.parsers import json_loads
+
 BatteryCyclerExperiment = CalculationFactory("aurora.cycler")
 
 
@@ -55,8 +57,6 @@ class TomatoParser(Parser):
         output_json_filename = self.node.get_option("output_filename") + ".json"
         output_zip_filename = os.path.join(retrieved_temporary_folder, self.node.get_option("output_filename") + ".zip")
 
-        files_retrieved = self.retrieved.list_object_names()
-
         # Check that zip file is present
         if os.path.isfile(output_zip_filename):
             try:
@@ -71,24 +71,27 @@ class TomatoParser(Parser):
             self.logger.warning(f"The raw data zip file '{output_zip_filename}' is missing.")
             output_raw_data_node_created = False
 
-        # Check that json file is present
-        if output_json_filename not in files_retrieved:
+        # Check that json file is present and read it
+        try:
+            with self.retrieved.open(output_json_filename, "rb") as handle:
+                output_json_content = handle.read()
+        except FileNotFoundError:
             self.logger.error(f"The output json file '{output_json_filename}' is missing.")
-            if output_raw_data_node_created:
-                # only json file is missing
-                return self.exit_codes.ERROR_OUTPUT_JSON_MISSING
-            # both files are missing
-            return self.exit_codes.ERROR_OUTPUT_FILES_MISSING
+            return self._get_output_json_missing_exit_code(output_raw_data_node_created)
+        except OSError:
+            self.logger.error(f"Error opening the json file '{output_json_filename}'.")
+            return self.exit_codes.ERROR_OUTPUT_JSON_READ
+
+        # Check that json file is not empty, e.g. left by a failed tomato job
+        if not output_json_content or output_json_content.isspace():
+            self.logger.error(f"The output json file '{output_json_filename}' is empty.")
+            return self._get_output_json_missing_exit_code(output_raw_data_node_created)
 
-        # If a json file was found, parse it and add output node
+        # Parse the json file and add output node
         try:
             self.logger.debug(f"Parsing '{output_json_filename}'")
-            with self.retrieved.open(output_json_filename, "r") as handle:
-                output_results_node = self.parse_tomato_results(json.load(handle), self.logger)
+            output_results_node = self.parse_tomato_results(json_loads(output_json_content), self.logger)
             self.out("results", output_results_node)
-        except OSError:
-            self.logger.error(f"Error opening the json file '{output_json_filename}'.")
-            return self.exit_codes.ERROR_OUTPUT_JSON_READ
         except json.JSONDecodeError:
             self.logger.error(f"Error parsing json file '{output_json_filename}'.")
             return self.exit_codes.ERROR_OUTPUT_JSON_PARSE
@@ -107,6 +110,19 @@ class TomatoParser(Parser):
 
         return ExitCode(0)
 
+    def _get_output_json_missing_exit_code(self, output_raw_data_node_created):
+        """
+        Return the exit code for a missing (or empty) output json file.
+
+        :param output_raw_data_node_created: whether the raw data zip file was stored
+        :returns: an exit code
+        """
+        if output_raw_data_node_created:
+            # only json file is missing
+            return self.exit_codes.ERROR_OUTPUT_JSON_MISSING
+        # both files are missing
+        return self.exit_codes.ERROR_OUTPUT_FILES_MISSING
+
     @staticmethod
     def parse_tomato_results(data_dic, logger=None):
         """
@@ -133,16 +149,16 @@ class TomatoParser(Parser):
 
         for key in keys:
             clean_key = re.sub("[^0-9a-zA-Z_]", "_", key)  # TODO necessary?
+            quantities = [step["raw"].get(key, fill) for step in data]
             for id in ("n", "s", "u"):
-                values = [step["raw"].get(key, fill)[id] for step in data]
-                parsed[f"step0_{clean_key}_{id}"] = np.array(values)
+                parsed[f"step0_{clean_key}_{id}"] = np.array([quantity[id] for quantity in quantities])
 
         parsed["step0_uts"] = np.array([step["uts"] for step in data])
 
         node = ArrayData()
         for key, value in parsed.items():
             node.set_array(key, value)
-            node.set_attribute_many(data_dic["metadata"])
+        node.set_attribute_many(data_dic["metadata"])
 
         if logger:
             logger.debug(f"parse_tomato_results: {list(parsed.keys())} stored")
@@ -3,6 +3,7 @@ Plugin for the Tomato scheduler.
 """
 import datetime
 import re
+import shlex
 
 import yaml
 
@@ -35,6 +36,9 @@ _MAP_STATUS_TOMATO = {
     "cd": JobState.DONE,
 }
 
+# `ketchup submit` reports the id of the submitted job as `jobid: {jobid}`
+_TOMATO_SUBMITTED_REGEXP = re.compile(r"^\s*jobid\s*:\s*(?P<quote>['\"]?)(?P<jobid>\d+)(?P=quote)\s*$", re.MULTILINE)
+
 _MAP_ANNOTATION_TOMATO = {
     "q": "Queued",
     "qw": "Queued, matching pipeline found",
@@ -115,11 +119,12 @@ class TomatoScheduler(Scheduler):
 
         if jobs:
             if isinstance(jobs, str):
-                command = f"{self.KETCHUP} status {escape_for_bash(jobs)}"
+                command = f"{self.KETCHUP} status {shlex.quote(jobs)}"
             else:
+                # all jobs are queried with a single `ketchup status` call
                 command = f"{self.KETCHUP} status "
                 try:
-                    command += " ".join(f"{j}" for j in jobs)
+                    command += shlex.join(map(str, jobs))
                 except TypeError as e:
                     raise TypeError(
                         "If provided, the 'jobs' variable must be a string or an iterable of strings"
@@ -257,7 +262,7 @@ class TomatoScheduler(Scheduler):
             )
 
         # remove all empty lines and lines containing 'ERROR'
-        jobdata_raw = "\n".join(l for l in stdout.splitlines() if l and "ERROR" not in l)
+        jobdata_lines = [l for l in stdout.splitlines() if l and "ERROR" not in l]
 
         def convert_datetime(dt):
             if isinstance(dt, datetime.datetime):
@@ -270,12 +275,12 @@ class TomatoScheduler(Scheduler):
         # Create dictionary and parse specific fields
         job_list = []
 
-        if "===========================" in jobdata_raw:
+        if any("===========================" in l for l in jobdata_lines):
             # the command was 'ketchup status queue'
-            jobdata_raw = jobdata_raw.splitlines()
-            if len(jobdata_raw) > 2:
-                for line in jobdata_raw[2:]:
-                    job = line.split()
+            # skip the header and separator lines
+            jobdata_raw = [l.split() for l in jobdata_lines[2:]]
+            if jobdata_raw:
+                for job in jobdata_raw:
                     this_job = JobInfo()
                     this_job.job_id = job[0]
                     this_job.title = job[1]
@@ -305,9 +310,13 @@ class TomatoScheduler(Scheduler):
         else:
             # the command was 'ketchup status {jobid} ...'
             # the output is yaml-formatted
-            jobdata_parsed = yaml.full_load(jobdata_raw)
+            jobdata_parsed = yaml.full_load("\n".join(jobdata_lines))
+
+            # a single job may be reported as a mapping rather than as a list of one
+            if isinstance(jobdata_parsed, dict):
+                jobdata_parsed = [jobdata_parsed]
 
-            for this_job_dict in jobdata_parsed:
+            for this_job_dict in jobdata_parsed or []:
                 this_job = JobInfo()
                 this_job.job_id = str(this_job_dict["jobid"])
                 this_job.title = this_job_dict["jobname"]
@@ -343,11 +352,21 @@ class TomatoScheduler(Scheduler):
             self._logger.warning(f"in _parse_submit_output there was some text in stderr: {stderr}")
 
         # I check for the jobid in the output
-        stdout_dict = yaml.full_load(stdout)
-        if "jobid" in stdout_dict:
-            self._logger.debug(f"The submitted jobid is {stdout_dict['jobid']}")
+        match = _TOMATO_SUBMITTED_REGEXP.search(stdout)
+        if match:
+            jobid = match.group("jobid")
+        else:
+            # fall back to loading the output as yaml, for any other format of the jobid
+            try:
+                stdout_dict = yaml.full_load(stdout)
+            except yaml.YAMLError:
+                stdout_dict = None
+            jobid = stdout_dict.get("jobid") if isinstance(stdout_dict, dict) else None
+
+        if jobid is not None:
+            self._logger.debug(f"The submitted jobid is {jobid}")
             # HACK did not need to str-cast prior to aiida 2.x upgrade
-            return str(stdout_dict["jobid"])
+            return str(jobid)
 
         # If I am here, no jobid was found
         self.logger.error(f"in _parse_submit_output: unable to find the job id: {stdout}")
@@ -132,7 +132,10 @@ class CapacityAnalyzer(Analyzer):
         if Q < Qt:
             self.report += f" - {(Qt - Q) / Qt * 100:.1f}% below threshold"
 
-        below_threshold = np.where(self.capacities < Qt)[0] + 1
+        if n < self.consecutive:
+            return  # too few cycles to be consecutively below threshold
+
+        below_threshold = self.capacities < Qt
         consecutively_below = self._filter_consecutive(below_threshold)
 
         if len(consecutively_below):
@@ -145,24 +148,28 @@ class CapacityAnalyzer(Analyzer):
             else:
                 self.flag = "🟡"
 
-    def _filter_consecutive(self, cycles: list[int]) -> list[int]:
+    def _filter_consecutive(self, below_threshold: np.ndarray) -> list[int]:
         """Return cycles below threshold for `x` consecutive cycles.
 
+        The length of the below-threshold run ending at each cycle is
+        computed from the last cycle above threshold, so no Python-level
+        loop is needed.
+
         Parameters
         ----------
-        `cycles` : `list[int]`
-            The cycles below threshold.
+        `below_threshold` : `np.ndarray`
+            The boolean below-threshold mask, one entry per cycle.
 
         Returns
         -------
         `list[int]`
             The cycles below threshold for `x` consecutive cycles.
         """
-        return [
-            cycle for i, cycle in enumerate(cycles)
-            if i >= self.consecutive - 1 and \
-            all(cycles[i - j] == cycle - j for j in range(1, self.consecutive))
-        ]
+        index = np.arange(len(below_threshold))
+        last_above = np.maximum.accumulate(np.where(below_threshold, -1, index))
+        run_lengths = index - last_above
+        consecutive = below_threshold & (run_lengths >= self.consecutive)
+        return (np.flatnonzero(consecutive) + 1).tolist()
 
     def _truncate_snapshot(self) -> None:
         """Truncate the snapshot to user defined size."""
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
+from typing import IO, Any, Callable, cast
 
 import numpy as np
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
 
-from aiida.orm import CalcJobNode, QueryBuilder, RemoteData, SinglefileData
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, QueryBuilder, RemoteData, SinglefileData, load_node
 
 from aiida_aurora.data import BatterySampleData
-from aiida_aurora.utils.parsers import get_data_from_raw, get_data_from_results
+from aiida_aurora.utils.parsers import get_data_from_results, get_data_from_stream
 
 
 def cycling_analysis(node: CalcJobNode) -> tuple[dict, str, DataFrame]:
@@ -81,8 +83,8 @@ def get_monitors(node: CalcJobNode) -> dict[str, dict]:
         A dictionary of monitors.
     """
 
-    if "monitors" in node.inputs:
-        return {k: dict(v) for k, v in dict(node.inputs.monitors).items()}
+    if (monitors := getattr(node.inputs, "monitors", None)) is not None:
+        return {k: dict(v) for k, v in dict(monitors).items()}
 
     # BACKWARDS COMPATABILITY
     # job submitted prior to AiiDA 2.x upgrade - fetch monitor calcjob
@@ -97,6 +99,9 @@ def get_node_monitor_calcjob(node: CalcJobNode) -> CalcJobNode | None:
     Uses the `QueryBuilder` to query for a monitor calcjob with
     a `RemoteData` node associated with the calculation node.
 
+    NOTE: the query result is cached for sealed nodes, as their
+    monitor calcjob can no longer change.
+
     Parameters
     ----------
     `node` : `CalcJobNode`
@@ -108,17 +113,39 @@ def get_node_monitor_calcjob(node: CalcJobNode) -> CalcJobNode | None:
         The associated monitor calcjob node, `None` if not found.
     """
 
-    if "remote_folder" not in node.outputs:
+    remote_folder: RemoteData | None = getattr(node.outputs, "remote_folder", None)
+
+    if remote_folder is None:
         return None
 
-    remote_folder: RemoteData = node.outputs.remote_folder
+    if node.is_sealed:
+        pk = _query_cached_monitor_calcjob_pk(remote_folder.uuid)
+    else:
+        pk = _query_monitor_calcjob_pk(remote_folder.uuid)
+
+    return cast(CalcJobNode, load_node(pk)) if pk is not None else None
+
+
+def _query_monitor_calcjob_pk(remote_folder_uuid: str) -> int | None:
+    """Query for the latest monitor calcjob of a remote folder.
+
+    Parameters
+    ----------
+    `remote_folder_uuid` : `str`
+        The UUID of the calculation's `RemoteData` node.
+
+    Returns
+    -------
+    `int | None`
+        The pk of the monitor calcjob node, `None` if not found.
+    """
 
     qb = QueryBuilder()
 
     qb.append(
         RemoteData,
         filters={
-            'uuid': remote_folder.uuid,
+            'uuid': remote_folder_uuid,
         },
         tag='remote_folder',
     ).append(
@@ -127,7 +154,7 @@ def get_node_monitor_calcjob(node: CalcJobNode) -> CalcJobNode | None:
         edge_filters={
             'label': 'monitor_folder'
         },
-        project=['*', 'id'],
+        project=['id'],
         tag='monitor',
     ).order_by({
         'monitor': {
@@ -135,8 +162,10 @@ def get_node_monitor_calcjob(node: CalcJobNode) -> CalcJobNode | None:
         },
     })
 
-    results = qb.first() if qb.count() else None
-    return results[0] if results else None
+    return qb.first(flat=True)
+
+
+_query_cached_monitor_calcjob_pk = lru_cache(maxsize=512)(_query_monitor_calcjob_pk)
 
 
 def convert_to_new_monitor_format(monitor: CalcJobNode) -> dict[str, dict]:
@@ -265,7 +294,7 @@ def process_data(node: CalcJobNode) -> tuple[dict, str, Styler | str]:
     was prepared by AiiDA upon a successful run. If not, in the
     case the job was terminated prematurely, the function will
     attempt to analyze (in order) the raw (non-parsed) results,
-    the retrieved results file, or if none was retrieved, the
+    the retrieved results file, or if none yields data, the
     snapshot fetched directly from the remote machine.
 
     Parameters
@@ -290,16 +319,22 @@ def process_data(node: CalcJobNode) -> tuple[dict, str, Styler | str]:
     if node.exit_status is None:
         data = get_data_from_snapshot(node.base.extras.get("snapshot", {}))
     else:
-        if "results" in node.outputs:
-            data = get_data_from_results(node.outputs.results)
-        elif "raw_data" in node.outputs:
-            data = get_data_from_file(node.outputs.raw_data)
-        elif "retrieved" in node.outputs:
-            data = get_data_from_file(node.outputs.retrieved)
-        elif "remote_folder" in node.outputs:
-            data = get_data_from_remote(node.outputs.remote_folder)
-        else:
-            data = {}
+        # ordered (output label, extractor) data sources
+        sources: tuple[tuple[str, Callable[[Any], dict]], ...] = (
+            ("results", get_data_from_results),
+            ("raw_data", get_data_from_file),
+            ("retrieved", get_data_from_file),
+            ("remote_folder", get_data_from_remote),
+        )
+
+        # fetch the output links once rather than querying per lookup
+        outputs = node.base.links.get_outgoing(link_type=LinkType.CREATE)
+        labels = set(outputs.all_link_labels())
+
+        data = {}
+        for label, get_data in sources:
+            if label in labels and (data := get_data(outputs.get_node_by_label(label))):
+                break
 
     return data, warning, add_analysis(data)
 
@@ -319,10 +354,10 @@ def get_data_from_file(source: SinglefileData) -> dict:
     `dict`
         The post-processed data dictionary.
     """
-    if "results.json" in source.base.repository.list_object_names():
-        file = source.base.repository.get_object_content("results.json")
-        raw = json.loads(file)
-        return get_data_from_raw(raw)
+    repository = source.base.repository
+    if "results.json" in repository.list_object_names():
+        with repository.open("results.json", "rb") as file:
+            return get_data_from_stream(cast(IO[bytes], file))
     return {}
 
 
@@ -341,8 +376,8 @@ def get_data_from_remote(source: RemoteData) -> dict:
     """
     try:
         remote_path = source.attributes["remote_path"]
-        with open(f"{remote_path}/snapshot.json") as file:
-            return get_data_from_file(file)
+        with open(f"{remote_path}/snapshot.json", "rb") as file:
+            return get_data_from_stream(file)
     except Exception:
         return {}
 
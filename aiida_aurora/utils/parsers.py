@@ -1,9 +1,49 @@
+from __future__ import annotations
+
+import json
+from typing import IO, Any
+
 import numpy as np
 from scipy.integrate import cumtrapz
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from aiida.orm import ArrayData
 
 
+def json_loads(content: bytes | str) -> Any:
+    """Deserialize JSON content.
+
+    Uses `orjson`, if installed. Content rejected by `orjson`, such
+    as the `NaN`/`Infinity` literals written by Python's `json`, is
+    parsed again with the standard library.
+
+    Parameters
+    ----------
+    `content` : `bytes | str`
+        The JSON content.
+
+    Returns
+    -------
+    `Any`
+        The deserialized object.
+
+    Raises
+    ------
+    `json.JSONDecodeError`
+        If `content` is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def get_data_from_raw(jsdata: dict) -> dict:
     """Extract raw data from json file.
 
@@ -41,6 +81,22 @@ def get_data_from_raw(jsdata: dict) -> dict:
     return post_process_data(t, Ewe, I)
 
 
+def get_data_from_stream(stream: IO[bytes]) -> dict:
+    """Extract raw data from a json file stream.
+
+    Parameters
+    ----------
+    `stream` : `IO[bytes]`
+        The raw JSON file, opened in binary mode.
+
+    Returns
+    -------
+    `dict`
+        The post-processed data.
+    """
+    return get_data_from_raw(json_loads(stream.read()))
+
+
 def get_data_from_results(array_node: ArrayData) -> dict:
     """Extract data from parsed ArrayData node.
 
@@ -13,3 +13,38 @@ def clear_database_auto(clear_database):  # pylint: disable=unused-argument
 def aurora_code(aiida_local_code_factory):
     """Get a aurora code."""
     return aiida_local_code_factory(executable="diff", entry_point="aurora")
+
+
+@pytest.fixture(scope="function")
+def tomato_results():
+    """Get a generated tomato results document with two full cycles.
+
+    Undefined standard errors are `NaN`, as written by tomato/yadg.
+    """
+    data = []
+    for i in range(80):
+        current = 1e-3 if (i // 20) % 2 == 0 else -1e-3
+        data.append({
+            "uts": 1.6e9 + 10.0 * i,
+            "raw": {
+                "Ewe": {
+                    "n": 3.5 + 1e-3 * i,
+                    "s": float("nan"),
+                    "u": "V"
+                },
+                "I": {
+                    "n": current,
+                    "s": 1e-6,
+                    "u": "A"
+                },
+            },
+        })
+    return {
+        "metadata": {
+            "provenance": "generated",
+        },
+        "steps": [{
+            "tag": "cycling",
+            "data": data
+        }],
+    }
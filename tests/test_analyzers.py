@@ -0,0 +1,72 @@
+""" Tests for the capacity analyzer
+
+"""
+import numpy as np
+import pytest
+
+from aiida_aurora.utils.analyzers import CapacityAnalyzer
+
+
+def check_capacity(capacities, consecutive_cycles=2):
+    """Run the capacity check on `capacities` and return the analyzer."""
+    analyzer = CapacityAnalyzer(consecutive_cycles=consecutive_cycles)
+    analyzer.capacities = np.array(capacities, dtype=float)
+    analyzer._check_capacity()
+    return analyzer
+
+
+@pytest.mark.parametrize(
+    "capacities, consecutive_cycles, expected_cycles, expected_flag",
+    [
+        # run at the start of the series
+        ([10, 7, 7, 9, 9, 9], 2, [3], "🟡"),
+        # run in the middle of the series
+        ([10, 9, 7, 7, 7, 9, 9], 2, [4, 5], "🟡"),
+        # run at the end of the series
+        ([10, 9, 9, 7, 7], 2, [5], "🔴"),
+        # run exactly `consecutive_cycles` long
+        ([10, 9, 7, 7, 9], 2, [4], "🟡"),
+        ([10, 9, 7, 7, 7], 3, [5], "🔴"),
+        # runs shorter than `consecutive_cycles`
+        ([10, 7, 9, 7, 9], 2, [], ""),
+        # every below-threshold cycle counts
+        ([10, 7, 9, 7, 9], 1, [2, 4], "🟡"),
+        ([10, 7, 9, 7, 9], 0, [2, 4], "🟡"),
+        ([10, 9, 9, 9, 7], 0, [5], "🔴"),
+    ],
+)
+def test_check_capacity(
+    capacities,
+    consecutive_cycles,
+    expected_cycles,
+    expected_flag,
+):
+    """Test the reported below-threshold cycles and the flag."""
+    analyzer = check_capacity(capacities, consecutive_cycles)
+    assert analyzer.flag == expected_flag
+    if expected_cycles:
+        assert analyzer.report.endswith(f" - cycles below threshold: {expected_cycles}")
+    else:
+        assert "cycles below threshold" not in analyzer.report
+
+
+def test_filter_consecutive():
+    """Test the cycles returned for a below-threshold mask."""
+    analyzer = CapacityAnalyzer(consecutive_cycles=2)
+    below_threshold = np.array([1, 1, 0, 1, 0, 0, 1, 1, 1], dtype=bool)
+    assert analyzer._filter_consecutive(below_threshold) == [2, 8, 9]
+
+
+def test_check_capacity_too_few_cycles():
+    """Test that fewer cycles than `consecutive_cycles` are not flagged."""
+    analyzer = check_capacity([10, 7, 7], consecutive_cycles=5)
+    assert analyzer.flag == ""
+    assert analyzer.report.startswith("cycle #3 : Q = 7.00 mAh (70.0%)")
+    assert "cycles below threshold" not in analyzer.report
+
+
+def test_check_capacity_single_cycle():
+    """Test that at least two cycles are required."""
+    analyzer = check_capacity([10])
+    assert analyzer.flag == ""
+    assert analyzer.report == "need at least two complete cycles"
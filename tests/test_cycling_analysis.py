@@ -0,0 +1,76 @@
+""" Tests for the cycling analysis utilities
+
+"""
+import io
+import json
+
+import numpy as np
+import pytest
+
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, FolderData, RemoteData, SinglefileData
+
+from aiida_aurora.utils.cycling_analysis import _query_cached_monitor_calcjob_pk, get_node_monitor_calcjob, process_data
+from aiida_aurora.utils.parsers import get_data_from_raw
+
+
+@pytest.fixture(scope="function")
+def monitored_calcjob(aiida_localhost):
+    """Get an unsealed calcjob and the monitor calcjob of its remote folder."""
+
+    node = CalcJobNode(computer=aiida_localhost).store()
+
+    remote_folder = RemoteData(remote_path="/tmp", computer=aiida_localhost)
+    remote_folder.base.links.add_incoming(node, LinkType.CREATE, "remote_folder")
+    remote_folder.store()
+
+    monitor = CalcJobNode(computer=aiida_localhost)
+    monitor.base.links.add_incoming(remote_folder, LinkType.INPUT_CALC, "monitor_folder")
+    monitor.store()
+
+    _query_cached_monitor_calcjob_pk.cache_clear()
+
+    return node, monitor
+
+
+def test_get_node_monitor_calcjob_unsealed(monitored_calcjob):
+    """Test that the monitor of an unsealed calcjob is not cached."""
+    node, monitor = monitored_calcjob
+    assert get_node_monitor_calcjob(node).pk == monitor.pk
+    assert get_node_monitor_calcjob(node).pk == monitor.pk
+    cache_info = _query_cached_monitor_calcjob_pk.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (0, 0)
+
+
+def test_get_node_monitor_calcjob_sealed(monitored_calcjob):
+    """Test that the monitor of a sealed calcjob is cached."""
+    node, monitor = monitored_calcjob
+    node.seal()
+    assert get_node_monitor_calcjob(node).pk == monitor.pk
+    assert get_node_monitor_calcjob(node).pk == monitor.pk
+    cache_info = _query_cached_monitor_calcjob_pk.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+def test_process_data_falls_through_sources(aiida_localhost, tomato_results):
+    """Test that a source without results falls through to the next one."""
+
+    node = CalcJobNode(computer=aiida_localhost)
+    node.set_exit_status(0)
+    node.store()
+
+    raw_data = SinglefileData(io.BytesIO(b"zip content"), filename="results.zip")
+    raw_data.base.links.add_incoming(node, LinkType.CREATE, "raw_data")
+    raw_data.store()
+
+    retrieved = FolderData()
+    retrieved.base.repository.put_object_from_bytes(json.dumps(tomato_results).encode(), "results.json")
+    retrieved.base.links.add_incoming(node, LinkType.CREATE, "retrieved")
+    retrieved.store()
+
+    data, warning, _ = process_data(node)
+
+    assert warning == ""
+    assert data.keys() == get_data_from_raw(tomato_results).keys()
+    for key, value in get_data_from_raw(tomato_results).items():
+        np.testing.assert_allclose(data[key], value, err_msg=key)
@@ -0,0 +1,96 @@
+""" Tests for parsers
+
+"""
+import io
+import json
+import math
+
+import numpy as np
+import pytest
+
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, FolderData
+
+from aiida_aurora.parsers import TomatoParser
+from aiida_aurora.utils.parsers import get_data_from_raw, get_data_from_stream, json_loads
+
+
+def test_json_loads_nan():
+    """Tests that `NaN` literals written by Python's `json` are parsed."""
+    content = json.dumps({"n": 1.0, "s": float("nan")}).encode()
+    parsed = json_loads(content)
+    assert parsed["n"] == 1.0
+    assert math.isnan(parsed["s"])
+
+
+def test_parse_tomato_results_nan(tomato_results):
+    """Tests parsing a results file containing `NaN` values."""
+    content = json.dumps(tomato_results).encode()
+    node = TomatoParser.parse_tomato_results(json_loads(content))
+    assert np.isnan(node.get_array("step0_Ewe_s")).all()
+    assert len(node.get_array("step0_uts")) == 80
+
+
+def assert_same_data(data, expected):
+    """Assert that two post-processed data dictionaries are equal."""
+    assert data.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_allclose(data[key], value, err_msg=key)
+
+
+def test_get_data_from_stream(tomato_results):
+    """Tests that the stream result equals the `get_data_from_raw` result."""
+    stream = io.BytesIO(json.dumps(tomato_results).encode())
+    assert_same_data(get_data_from_stream(stream), get_data_from_raw(tomato_results))
+
+
+@pytest.fixture(scope="function")
+def parse_retrieved(aiida_localhost, tmp_path):
+    """Get a function parsing a retrieved folder with the `TomatoParser`.
+
+    `json_content` is the content of the output json file, if any, and
+    `zip_file` indicates whether the raw data zip file is retrieved.
+    """
+
+    def _parse_retrieved(json_content=None, zip_file=True):
+        node = CalcJobNode(computer=aiida_localhost, process_type="aiida.calculations:aurora.cycler")
+        node.set_option("output_filename", "results")
+        node.base.attributes.set("last_job_info", {"annotation": "Completed"})
+        node.store()
+
+        retrieved = FolderData()
+        if json_content is not None:
+            retrieved.base.repository.put_object_from_bytes(json_content, "results.json")
+        retrieved.base.links.add_incoming(node, LinkType.CREATE, "retrieved")
+        retrieved.store()
+
+        if zip_file:
+            (tmp_path / "results.zip").write_bytes(b"zip content")
+
+        parser = TomatoParser(node)
+        return parser, parser.parse(retrieved_temporary_folder=str(tmp_path))
+
+    return _parse_retrieved
+
+
+@pytest.mark.parametrize("json_content", [None, b"", b" \n"])
+@pytest.mark.parametrize(
+    "zip_file, exit_code",
+    [
+        (True, "ERROR_OUTPUT_JSON_MISSING"),
+        (False, "ERROR_OUTPUT_FILES_MISSING"),
+    ],
+)
+def test_parse_json_missing(parse_retrieved, json_content, zip_file, exit_code):
+    """Tests that a missing or empty json file is reported as missing."""
+    parser, result = parse_retrieved(json_content, zip_file)
+    assert result == parser.exit_codes[exit_code]
+    assert "results" not in parser.outputs
+
+
+def test_parse(parse_retrieved, tomato_results):
+    """Tests parsing a valid json file."""
+    parser, result = parse_retrieved(json.dumps(tomato_results).encode())
+    assert result.status == 0
+    assert len(parser.outputs["results"].get_array("step0_uts")) == 80
+    assert "raw_data" in parser.outputs
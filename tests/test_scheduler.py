@@ -0,0 +1,124 @@
+""" Tests for the tomato scheduler
+
+"""
+import datetime
+
+import pytest
+
+from aiida.schedulers import SchedulerError
+from aiida.schedulers.datastructures import JobState
+
+from aiida_aurora.scheduler import TomatoScheduler
+
+KETCHUP_STATUS_QUEUE = """\
+jobid  jobname         status pipeline             pid
+==============================================================
+1      None            c
+2      custom_name     cd
+4      other_name      q
+"""
+
+KETCHUP_STATUS_QUEUE_EMPTY = """\
+jobid  jobname         status pipeline             pid
+==============================================================
+"""
+
+KETCHUP_STATUS_JOBS = """\
+- jobid: 1
+  jobname: null
+  status:  c
+  submitted: 2022-06-02 06:49:00.578619+00:00
+  executed: 2022-06-02 06:49:02.966775+00:00
+  completed: 2022-06-02 06:49:08.229213+00:00
+- jobid: 4
+  jobname: other_name
+  status:  q
+  submitted: 2022-06-02 06:50:00.578619+00:00
+"""
+
+KETCHUP_STATUS_JOB_MAPPING = """\
+jobid: 3
+jobname: null
+status:  r
+submitted: 2022-06-02 06:49:00.578619+00:00
+executed: 2022-06-02 06:49:02.966775+00:00
+pipeline: dummy-10
+"""
+
+KETCHUP_SUBMIT = """\
+jobid: 5
+jobname: dummy_random_2_0.1
+"""
+
+KETCHUP_SUBMIT_VERBOSE = """\
+INFO:tomato.ketchup.functions:queueing 'payload' into 'queue'
+INFO:tomato.dbhandler.sqlite:inserting a new job into 'state'
+jobid: 4
+jobname: null
+"""
+
+
+@pytest.fixture(scope="function")
+def scheduler():
+    """Get a tomato scheduler."""
+    return TomatoScheduler()
+
+
+def test_parse_joblist_queue(scheduler):
+    """Tests parsing the output of `ketchup status queue`."""
+    jobs = scheduler._parse_joblist_output(0, KETCHUP_STATUS_QUEUE, "")
+    assert [job.job_id for job in jobs] == ["1", "2", "4"]
+    assert [job.title for job in jobs] == ["None", "custom_name", "other_name"]
+    assert [job.job_state for job in jobs] == [JobState.DONE, JobState.DONE, JobState.QUEUED]
+    assert jobs[1].annotation == "Cancelled"
+
+
+def test_parse_joblist_queue_empty(scheduler):
+    """Tests parsing the output of `ketchup status queue` with no jobs."""
+    assert scheduler._parse_joblist_output(0, KETCHUP_STATUS_QUEUE_EMPTY, "") == []
+
+
+def test_parse_joblist_jobs(scheduler):
+    """Tests parsing the output of `ketchup status {jobid} ...` for several jobs."""
+    stdout = f"ERROR: job with jobid '5' does not exist.\n{KETCHUP_STATUS_JOBS}"
+    jobs = scheduler._parse_joblist_output(0, stdout, "")
+    assert [job.job_id for job in jobs] == ["1", "4"]
+    assert [job.job_state for job in jobs] == [JobState.DONE, JobState.QUEUED]
+    assert jobs[0].annotation == "Completed successfully"
+    assert jobs[0].finish_time == datetime.datetime(2022, 6, 2, 6, 49, 8, 229213, tzinfo=datetime.timezone.utc)
+    assert jobs[1].title == "other_name"
+
+
+def test_parse_joblist_job_mapping(scheduler):
+    """Tests parsing the status of a single job reported as a mapping."""
+    jobs = scheduler._parse_joblist_output(0, KETCHUP_STATUS_JOB_MAPPING, "")
+    assert len(jobs) == 1
+    assert jobs[0].job_id == "3"
+    assert jobs[0].job_state == JobState.RUNNING
+    assert jobs[0].allocated_machines == "dummy-10"
+
+
+def test_get_joblist_command(scheduler):
+    """Tests that several jobs are queried with a single command."""
+    assert scheduler._get_joblist_command(jobs=["1", "4"]) == "ketchup status 1 4"
+    assert scheduler._get_joblist_command() == "ketchup status queue -v"
+
+
+@pytest.mark.parametrize(
+    "stdout,jobid",
+    [
+        (KETCHUP_SUBMIT, "5"),
+        (KETCHUP_SUBMIT_VERBOSE, "4"),
+        ("jobid: '12'\njobname: null\n", "12"),
+        ("{jobid: 7, jobname: null}", "7"),
+    ],
+)
+def test_parse_submit_output(scheduler, stdout, jobid):
+    """Tests parsing the job id from the output of `ketchup submit`."""
+    assert scheduler._parse_submit_output(0, stdout, "") == jobid
+
+
+def test_parse_submit_output_no_jobid(scheduler):
+    """Tests that a missing job id raises a `SchedulerError`."""
+    with pytest.raises(SchedulerError):
+        scheduler._parse_submit_output(0, "ERROR: payload could not be submitted\n", "")